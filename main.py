@@ -3,10 +3,14 @@ XView AstrBot 插件
 用于解析 https://secure.xview.tv/ 网站视频信息
 """
 import os
+import time
 import asyncio
+import uuid
+import hashlib
 import traceback
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 
 from astrbot.api.event import filter, AstrMessageEvent
 from astrbot.api.star import Context, Star, register
@@ -14,7 +18,8 @@ from astrbot.api import logger
 import astrbot.api.message_components as Comp
 from astrbot.api.event import MessageChain
 
-try:
+# 作为插件包加载时使用相对导入，直接运行时使用绝对导入
+if __package__:
     from .modules.client import Client
     from .modules.video import Video
     from .modules.errors import (
@@ -24,8 +29,8 @@ try:
         InvalidURL,
         NetworkError,
     )
-    from .modules.consts import ROOT_URL
-except ImportError:
+    from .modules.consts import ROOT_URL, THUMB_CACHE_SIZE
+else:
     from modules.client import Client
     from modules.video import Video
     from modules.errors import (
@@ -35,18 +40,29 @@ except ImportError:
         InvalidURL,
         NetworkError,
     )
-    from modules.consts import ROOT_URL
+    from modules.consts import ROOT_URL, THUMB_CACHE_SIZE
 
 
 @register("astrbot_plugin_xview", "vmoranv", "XView 视频解析插件，支持获取视频信息、缩略图等", "1.0.0")
 class XViewPlugin(Star):
     """XView 视频解析插件"""
 
+    # 视频信息模板，可选字段以带换行符的整行填入，缺失时为空字符串
+    _VIDEO_INFO_TEMPLATE = (
+        "🎬 标题: {title}\n"
+        "🆔 ID: {video_id}"
+        "{duration_line}{views_line}{rating_line}{likes_line}"
+        "{uploader_line}{date_line}{tags_line}{qualities_line}\n"
+        "🔗 链接: {url}\u200E"
+    )
+
     def __init__(self, context: Context):
         super().__init__(context)
         self._client: Optional[Client] = None
         self._cache_dir: Optional[Path] = None
-        self._last_cache_files: list = []
+        self._cache_ttl: int = 300
+        # (video_id, blur_level) -> (写入时间, 文件路径)，按最近使用顺序排列
+        self._thumb_cache: "OrderedDict[Tuple[str, int], Tuple[float, str]]" = OrderedDict()
 
     async def initialize(self):
         """插件初始化"""
@@ -60,7 +76,18 @@ class XViewPlugin(Star):
         # 初始化客户端
         proxy = self._get_config("proxy", "")
         timeout = self._get_config("timeout", 30)
-        self._client = Client(proxy=proxy if proxy else None, timeout=timeout)
+        cache_ttl = self._get_config("cache_ttl", 300)
+        self._cache_ttl = cache_ttl
+        pool_limit = self._get_config("pool_limit", 100)
+        pool_limit_per_host = self._get_config("pool_limit_per_host", 20)
+        self._client = Client(
+            proxy=proxy if proxy else None,
+            timeout=timeout,
+            cache_ttl=cache_ttl,
+            pool_limit=pool_limit,
+            pool_limit_per_host=pool_limit_per_host,
+        )
+        await self._client.start()
 
         logger.info("XView 插件初始化完成")
 
@@ -71,7 +98,7 @@ class XViewPlugin(Star):
         if self._client:
             await self._client.close()
 
-        await self._cleanup_cache()
+        await self._cleanup_cache(clear_all=True)
 
         logger.info("XView 插件已销毁")
 
@@ -84,63 +111,174 @@ class XViewPlugin(Star):
         except Exception:
             return default
 
-    async def _cleanup_cache(self):
-        """清理上次发送的缓存文件"""
-        for file_path in self._last_cache_files:
-            try:
-                if os.path.exists(file_path):
-                    os.remove(file_path)
-                    logger.debug(f"已清理缓存文件: {file_path}")
-            except Exception as e:
-                logger.warning(f"清理缓存文件失败: {e}")
-
-        self._last_cache_files.clear()
-
-    async def _save_thumbnail(self, image_data: bytes, video_id: str) -> str:
-        """保存缩略图到缓存"""
-        file_path = self._cache_dir / f"thumb_{video_id}.jpg"
-        with open(file_path, "wb") as f:
-            f.write(image_data)
-        self._last_cache_files.append(str(file_path))
-        return str(file_path)
-
-    def _format_video_info(self, video: Video) -> str:
-        """格式化视频完整信息"""
-        lines = []
-        lines.append(f"🎬 标题: {video.title or '未知'}")
-        lines.append(f"🆔 ID: {video.video_id}")
-
-        if video.duration_formatted:
-            lines.append(f"⏱️ 时长: {video.duration_formatted}")
+    @staticmethod
+    async def _remove_cache_file(file_path: str) -> None:
+        """删除单个缓存文件，文件已不存在时忽略"""
+        try:
+            await asyncio.to_thread(os.remove, file_path)
+            logger.debug(f"已清理缓存文件: {file_path}")
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"清理缓存文件失败: {e}")
 
-        if video.views:
-            lines.append(f"👁️ 观看: {video.views:,}")
+    async def _remove_unreferenced_files(self, file_paths: set) -> None:
+        """删除不再被任何缓存条目引用的文件"""
+        in_use = {file_path for _, file_path in self._thumb_cache.values()}
+        orphaned = file_paths - in_use
+        if not orphaned:
+            return
 
-        if video.rating:
-            lines.append(f"⭐ 评分: {video.rating}")
+        # 文件删除放到线程中并发执行，避免阻塞事件循环
+        await asyncio.gather(*(self._remove_cache_file(file_path) for file_path in orphaned))
+
+    async def _cleanup_cache(self, clear_all: bool = False):
+        """淘汰过期或超出容量的缩略图缓存"""
+        now = time.monotonic()
+        stale = [
+            key for key, (saved_at, _) in self._thumb_cache.items()
+            if clear_all or now - saved_at > self._cache_ttl
+        ]
+
+        # 超出容量时从最久未使用的条目开始淘汰
+        excess = len(self._thumb_cache) - len(stale) - THUMB_CACHE_SIZE
+        if excess > 0:
+            stale_keys = set(stale)
+            for key in self._thumb_cache:
+                if excess <= 0:
+                    break
+                if key not in stale_keys:
+                    stale.append(key)
+                    excess -= 1
+
+        if not stale:
+            return
 
-        if video.likes:
-            lines.append(f"👍 点赞: {video.likes:,}")
+        evicted = {self._thumb_cache.pop(key)[1] for key in stale}
+        await self._remove_unreferenced_files(evicted)
+
+    def _get_cached_thumbnail(self, key: Tuple[str, int]) -> Optional[str]:
+        """获取仍然有效的缓存缩略图路径"""
+        entry = self._thumb_cache.get(key)
+        if entry is None:
+            return None
+
+        saved_at, file_path = entry
+        if time.monotonic() - saved_at > self._cache_ttl or not os.path.exists(file_path):
+            return None
+
+        self._thumb_cache.move_to_end(key)
+        return file_path
+
+    @staticmethod
+    def _guess_image_suffix(image_data: bytes) -> str:
+        """根据文件头判断图片扩展名（模糊处理后的缩略图为 WebP）"""
+        if image_data[:4] == b"RIFF" and image_data[8:12] == b"WEBP":
+            return ".webp"
+        return ".jpg"
+
+    async def _save_thumbnail(self, image_data: bytes, video_id: str, blur_level: int = 0) -> str:
+        """保存缩略图到缓存，文件名按内容哈希命名，相同内容只写一次"""
+        digest = hashlib.sha1(image_data).hexdigest()[:12]
+        suffix = self._guess_image_suffix(image_data)
+        file_path = self._cache_dir / f"thumb_{digest}{suffix}"
+        if not file_path.exists():
+            await asyncio.to_thread(file_path.write_bytes, image_data)
+
+        await self._remember_thumbnail((video_id, blur_level), str(file_path))
+        return str(file_path)
 
-        if video.uploader:
-            lines.append(f"👤 上传者: {video.uploader}")
+    async def _remember_thumbnail(self, key: Tuple[str, int], file_path: str) -> None:
+        """记录缩略图缓存条目，并删除被替换且不再引用的旧文件"""
+        previous = self._thumb_cache.get(key)
+        self._thumb_cache[key] = (time.monotonic(), file_path)
+        self._thumb_cache.move_to_end(key)
+        if previous and previous[1] != file_path:
+            await self._remove_unreferenced_files({previous[1]})
+
+    async def _stream_thumbnail(self, video: Video) -> Optional[str]:
+        """将未模糊的缩略图直接流式写入磁盘，不在内存中缓冲整张图片"""
+        thumbnail_url = video.thumbnail
+        if not thumbnail_url:
+            return None
+
+        digest = hashlib.sha1()
+        part_path = self._cache_dir / f"thumb_{uuid.uuid4().hex}.part"
+        replaced = False
+        try:
+            size = await self._client.stream_to_file(thumbnail_url, part_path, digest)
+            if not size:
+                return None
+
+            # 未经处理的原图沿用 .jpg 扩展名
+            file_path = self._cache_dir / f"thumb_{digest.hexdigest()[:12]}.jpg"
+            await asyncio.to_thread(os.replace, part_path, file_path)
+            replaced = True
+        except Exception as e:
+            logger.error(f"下载缩略图失败: {e}")
+            return None
+        finally:
+            if not replaced:
+                # 出错、超时或命令被取消（CancelledError 不属于 Exception）时都删除临时文件；
+                # 同步删除，避免在已取消的任务中再次 await
+                try:
+                    os.remove(part_path)
+                except FileNotFoundError:
+                    pass
 
-        if video.publish_date:
-            lines.append(f"📅 发布: {video.publish_date}")
+        return str(file_path)
 
-        if video.tags:
-            tags_str = ", ".join(video.tags[:5])
-            if len(video.tags) > 5:
-                tags_str += f" (+{len(video.tags) - 5})"
-            lines.append(f"🏷️ 标签: {tags_str}")
+    async def _get_thumbnail_path(self, video: Video, blur_level: int) -> Optional[str]:
+        """获取缩略图本地路径，优先使用缓存"""
+        key = (video.video_id, blur_level)
+        cached = self._get_cached_thumbnail(key)
+        if cached:
+            return cached
 
-        if video.available_qualities:
-            qualities_str = ", ".join(f"{q}p" for q in video.available_qualities[:5])
-            lines.append(f"📺 可用质量: {qualities_str}")
+        if blur_level <= 0:
+            file_path = await self._stream_thumbnail(video)
+            if file_path:
+                await self._remember_thumbnail(key, file_path)
+            return file_path
 
-        lines.append(f"🔗 链接: {video.url}")
+        thumbnail_data = await self._client.download_thumbnail_for(video, blur_level)
+        if not thumbnail_data:
+            return None
+        return await self._save_thumbnail(thumbnail_data, video.video_id, blur_level)
 
-        return "\n".join(lines) + "\u200E"
+    def _format_video_info(self, video: Video) -> str:
+        """格式化视频完整信息"""
+        duration = video.duration_formatted
+        views = video.views
+        rating = video.rating
+        likes = video.likes
+        uploader = video.uploader
+        publish_date = video.publish_date
+
+        tags = video.tags
+        tags_line = ""
+        if tags:
+            tags_str = ", ".join(tags[:5])
+            if len(tags) > 5:
+                tags_str += f" (+{len(tags) - 5})"
+            tags_line = f"\n🏷️ 标签: {tags_str}"
+
+        qualities = video.available_qualities
+        qualities_line = f"\n📺 可用质量: {', '.join(f'{q}p' for q in qualities[:5])}" if qualities else ""
+
+        return self._VIDEO_INFO_TEMPLATE.format(
+            title=video.title or '未知',
+            video_id=video.video_id,
+            duration_line=f"\n⏱️ 时长: {duration}" if duration else "",
+            views_line=f"\n👁️ 观看: {views:,}" if views else "",
+            rating_line=f"\n⭐ 评分: {rating}" if rating else "",
+            likes_line=f"\n👍 点赞: {likes:,}" if likes else "",
+            uploader_line=f"\n👤 上传者: {uploader}" if uploader else "",
+            date_line=f"\n📅 发布: {publish_date}" if publish_date else "",
+            tags_line=tags_line,
+            qualities_line=qualities_line,
+            url=video.url,
+        )
 
     def _format_error(self, error: Exception) -> str:
         """格式化错误信息"""
@@ -175,10 +313,9 @@ class XViewPlugin(Star):
 
             # 获取缩略图
             blur_level = self._get_config("blur_level", 0)
-            thumbnail_data = await self._client.download_thumbnail(video_id, blur_level)
+            thumb_path = await self._get_thumbnail_path(video, blur_level)
 
-            if thumbnail_data:
-                thumb_path = await self._save_thumbnail(thumbnail_data, video.video_id)
+            if thumb_path:
                 chain = [
                     Comp.Image.fromFileSystem(thumb_path),
                     Comp.Plain(info_text),
@@ -228,13 +365,11 @@ class XViewPlugin(Star):
             return
 
         try:
+            video = await self._client.get_video(video_id)
             blur_level = self._get_config("blur_level", 0)
-            thumbnail_data = await self._client.download_thumbnail(video_id, blur_level)
-
-            if thumbnail_data:
-                video = await self._client.get_video(video_id)
-                thumb_path = await self._save_thumbnail(thumbnail_data, video.video_id)
+            thumb_path = await self._get_thumbnail_path(video, blur_level)
 
+            if thumb_path:
                 chain = [
                     Comp.Image.fromFileSystem(thumb_path),
                     Comp.Plain(f"📷 {video.title or video_id}\u200E"),
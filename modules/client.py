@@ -2,33 +2,172 @@
 XView API Client 类
 用于发送 HTTP 请求和管理会话
 """
+import io
+import time
 import asyncio
 import aiohttp
 import logging
-from typing import Optional, Dict, Any, List
-from urllib.parse import urljoin
-
-from .consts import ROOT_URL, HEADERS, DEFAULT_TIMEOUT, REQUEST_TIMEOUT
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Optional, Dict, Any, List, Tuple, AsyncIterator
+
+from yarl import URL
+
+try:
+    from PIL import Image, ImageFilter
+    _HAS_PIL = True
+except ImportError:
+    _HAS_PIL = False
+
+from .consts import (
+    ROOT_URL,
+    FROZEN_HEADERS,
+    DEFAULT_TIMEOUT,
+    REQUEST_TIMEOUT,
+    DEFAULT_POOL_LIMIT,
+    DEFAULT_POOL_LIMIT_PER_HOST,
+    KEEPALIVE_TIMEOUT,
+    MIN_PAGE_SIZE,
+    RATE_LIMIT_PER_SECOND,
+    RATE_LIMIT_MIN_PER_SECOND,
+    RATE_LIMIT_MAX_RETRIES,
+    RETRY_AFTER_DEFAULT,
+    RETRY_AFTER_MAX,
+    VIDEO_CACHE_TTL,
+    VIDEO_CACHE_SIZE,
+    BLUR_MAX_WORKERS,
+    REGEX_SEARCH_COMBINED,
+    MAX_SEARCH_RESULTS,
+)
 from .errors import NetworkError, VideoNotFound
 from .video import Video
 
 
+def _blur_sync(image_data: bytes, blur_level: int) -> bytes:
+    """
+    同步执行图片模糊处理（在线程池中运行）
+
+    Args:
+        image_data: 原始图片数据
+        blur_level: 模糊程度 (0-100)
+
+    Returns:
+        模糊后的图片数据
+    """
+    # 将字节转换为 PIL Image
+    img = Image.open(io.BytesIO(image_data))
+    if img.mode not in ("RGB", "RGBA", "L"):
+        img = img.convert("RGB")
+
+    # 计算模糊半径（基于模糊程度）
+    # blur_level 0-100 映射到 radius 0-50
+    radius = blur_level / 2
+
+    if blur_level > 50:
+        # 模糊程度很高时添加马赛克效果：先用 reduce 按块缩小，
+        # 在小图上做等效半径的高斯模糊，再最近邻放大回原尺寸
+        factor = max(1, (blur_level - 50) // 10) * 2
+        small = img.reduce(factor)
+        small = small.filter(ImageFilter.GaussianBlur(radius=radius / factor))
+        blurred = small.resize(img.size, Image.NEAREST)
+    else:
+        # 应用高斯模糊
+        blurred = img.filter(ImageFilter.GaussianBlur(radius=radius))
+
+    # 转换回字节（WebP 比同等质量的 JPEG 更小、编码更快）
+    # 预分配缓冲区减少编码过程中的扩容，写完后截断多余部分
+    output = io.BytesIO(bytearray(max(len(image_data) // 2, 16384)))
+    blurred.save(output, format='WEBP', quality=80, method=4)
+    output.truncate()
+    return output.getvalue()
+
+
+class _TokenBucket:
+    """
+    令牌桶限速器
+
+    按固定速率补充令牌，每个请求消耗一个令牌；
+    收到 429 时速率减半，之后每次成功请求加性恢复（AIMD）
+    """
+
+    def __init__(self, rate: float, min_rate: float = RATE_LIMIT_MIN_PER_SECOND):
+        """
+        初始化令牌桶
+
+        Args:
+            rate: 每秒请求数上限
+            min_rate: 限流后速率下限
+        """
+        self.max_rate = rate
+        self.min_rate = min_rate
+        self.rate = rate
+        self._tokens = rate
+        self._last_refill = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """获取一个令牌，令牌不足时等待"""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.rate, self._tokens + (now - self._last_refill) * self.rate)
+                self._last_refill = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+    def on_success(self) -> None:
+        """请求成功，逐步恢复速率"""
+        if self.rate < self.max_rate:
+            self.rate = min(self.max_rate, self.rate + 1)
+
+    def on_throttled(self) -> None:
+        """被服务器限流，速率减半"""
+        self.rate = max(self.min_rate, self.rate / 2)
+        self._tokens = min(self._tokens, self.rate)
+
+
 class Client:
     """
     XView API 客户端类
     """
 
-    def __init__(self, proxy: Optional[str] = None, timeout: int = DEFAULT_TIMEOUT):
+    def __init__(
+        self,
+        proxy: Optional[str] = None,
+        timeout: int = DEFAULT_TIMEOUT,
+        cache_ttl: int = VIDEO_CACHE_TTL,
+        cache_size: int = VIDEO_CACHE_SIZE,
+        pool_limit: int = DEFAULT_POOL_LIMIT,
+        pool_limit_per_host: int = DEFAULT_POOL_LIMIT_PER_HOST,
+    ):
         """
         初始化客户端
 
         Args:
             proxy: 代理地址 (如 "http://127.0.0.1:7890")
             timeout: 请求超时时间（秒）
+            cache_ttl: Video 对象缓存有效期（秒），0 表示不缓存
+            cache_size: Video 对象缓存最大条目数
+            pool_limit: 连接池最大连接数
+            pool_limit_per_host: 单个主机最大连接数
         """
         self.proxy = proxy
         self.timeout = timeout
+        self.cache_ttl = cache_ttl
+        self.cache_size = cache_size
+        self.pool_limit = pool_limit
+        self.pool_limit_per_host = pool_limit_per_host
         self._session: Optional[aiohttp.ClientSession] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # 并发请求上限与按主机划分的令牌桶
+        self._limiter = asyncio.Semaphore(pool_limit_per_host)
+        self._buckets: Dict[str, _TokenBucket] = {}
+        # video_id -> (过期时间, Video)，按最近使用顺序排列
+        self._video_cache: "OrderedDict[str, Tuple[float, Video]]" = OrderedDict()
         self.logger = logging.getLogger("XView API - [Client]")
 
     async def _get_session(self) -> aiohttp.ClientSession:
@@ -41,8 +180,9 @@ class Client:
         if self._session is None or self._session.closed:
             timeout = aiohttp.ClientTimeout(total=self.timeout)
             connector = aiohttp.TCPConnector(
-                limit=10,
-                limit_per_host=5,
+                limit=self.pool_limit,
+                limit_per_host=self.pool_limit_per_host,
+                keepalive_timeout=KEEPALIVE_TIMEOUT,
                 ttl_dns_cache=300,
                 use_dns_cache=True,
                 ssl=False,  # 禁用 SSL 验证
@@ -50,52 +190,127 @@ class Client:
             self._session = aiohttp.ClientSession(
                 connector=connector,
                 timeout=timeout,
-                headers=HEADERS,
+                headers=FROZEN_HEADERS,
+                proxy=self.proxy,  # 会话级代理，单次请求无需再传入
                 trust_env=True,
             )
         return self._session
 
+    async def start(self) -> None:
+        """预先创建会话，避免首个请求承担建连开销"""
+        await self._get_session()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """
+        获取或创建图片处理线程池
+
+        Returns:
+            ThreadPoolExecutor
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=BLUR_MAX_WORKERS,
+                thread_name_prefix="xview-blur",
+            )
+        return self._executor
+
     async def close(self) -> None:
         """关闭会话"""
         if self._session and not self._session.closed:
             await self._session.close()
             self._session = None
 
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
     async def __aenter__(self):
         """异步上下文管理器入口"""
+        await self.start()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """异步上下文管理器出口"""
         await self.close()
 
-    async def fetch(self, url: str, method: str = "GET", **kwargs) -> str:
+    def _get_bucket(self, url: str) -> _TokenBucket:
         """
-        发送 HTTP 请求
+        获取 URL 所属主机的令牌桶
 
         Args:
             url: 请求 URL
+
+        Returns:
+            _TokenBucket
+        """
+        host = URL(url).host or ""
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            bucket = self._buckets[host] = _TokenBucket(RATE_LIMIT_PER_SECOND)
+        return bucket
+
+    @staticmethod
+    def _parse_retry_after(response: aiohttp.ClientResponse) -> float:
+        """
+        解析 Retry-After 响应头
+
+        Args:
+            response: 429 响应
+
+        Returns:
+            需要等待的秒数
+        """
+        value = response.headers.get(aiohttp.hdrs.RETRY_AFTER, "")
+        delay = float(value) if value.isdigit() else RETRY_AFTER_DEFAULT
+        return min(delay, RETRY_AFTER_MAX)
+
+    @asynccontextmanager
+    async def _request(
+        self, method: str, url: str, raise_not_found: bool = True, **kwargs
+    ) -> AsyncIterator[aiohttp.ClientResponse]:
+        """
+        发送经过限速的 HTTP 请求
+
+        收到 429 时按 Retry-After 等待并重试，同时降低该主机的请求速率。
+
+        Args:
             method: HTTP 方法
+            url: 请求 URL
+            raise_not_found: 404 时是否抛出 VideoNotFound
             **kwargs: 其他 aiohttp 请求参数
 
-        Returns:
-            响应文本
+        Yields:
+            状态码正常的响应对象
 
         Raises:
+            VideoNotFound: 页面不存在
             NetworkError: 网络请求失败
         """
-        session = await self._get_session()
-
-        # 设置代理
-        if self.proxy:
-            kwargs["proxy"] = self.proxy
+        session = self._session
+        if session is None:
+            session = await self._get_session()
+        bucket = self._get_bucket(url)
 
         try:
-            async with session.request(method, url, **kwargs) as response:
-                if response.status == 404:
-                    raise VideoNotFound(f"页面不存在: {url}")
-                response.raise_for_status()
-                return await response.text()
+            for attempt in range(RATE_LIMIT_MAX_RETRIES + 1):
+                # 先按主机取令牌再占用并发名额，等待令牌时不占用其他主机可用的名额
+                await bucket.acquire()
+                async with self._limiter:
+                    async with session.request(method, url, **kwargs) as response:
+                        if response.status == 429 and attempt < RATE_LIMIT_MAX_RETRIES:
+                            bucket.on_throttled()
+                            delay = self._parse_retry_after(response)
+                        else:
+                            if raise_not_found and response.status == 404:
+                                raise VideoNotFound(f"页面不存在: {url}")
+                            response.raise_for_status()
+                            bucket.on_success()
+                            yield response
+                            return
+
+                # 在释放并发名额之后再等待 Retry-After，避免被限流的主机拖住其他请求
+                self.logger.warning(f"请求被限流，{delay} 秒后重试: {url}")
+                await asyncio.sleep(delay)
         except aiohttp.ClientError as e:
             self.logger.error(f"网络请求失败: {e}")
             raise NetworkError(f"网络请求失败: {str(e)}")
@@ -103,6 +318,45 @@ class Client:
             self.logger.error(f"请求超时: {url}")
             raise NetworkError(f"请求超时: {url}")
 
+    async def fetch(self, url: str, method: str = "GET", **kwargs) -> str:
+        """
+        发送 HTTP 请求
+
+        Args:
+            url: 请求 URL
+            method: HTTP 方法
+            **kwargs: 其他 aiohttp 请求参数
+
+        Returns:
+            响应文本
+
+        Raises:
+            NetworkError: 网络请求失败
+        """
+        async with self._request(method, url, **kwargs) as response:
+            return await response.text()
+
+    async def fetch_raw(self, url: str, method: str = "GET", **kwargs) -> bytes:
+        """
+        发送 HTTP 请求并返回未解码的响应正文
+
+        与 fetch 的错误处理一致，但跳过字符集检测与解码，
+        适合只需对 ASCII 内容做字节正则匹配的场景
+
+        Args:
+            url: 请求 URL
+            method: HTTP 方法
+            **kwargs: 其他 aiohttp 请求参数
+
+        Returns:
+            响应字节数据
+
+        Raises:
+            NetworkError: 网络请求失败
+        """
+        async with self._request(method, url, **kwargs) as response:
+            return await response.read()
+
     async def fetch_bytes(self, url: str, method: str = "GET", **kwargs) -> bytes:
         """
         发送 HTTP 请求并返回字节数据
@@ -115,23 +369,128 @@ class Client:
         Returns:
             响应字节数据
         """
-        session = await self._get_session()
+        async with self._request(method, url, raise_not_found=False, **kwargs) as response:
+            return await response.read()
+
+    async def stream_to_file(
+        self, url: str, path: Path, digest: Optional[Any] = None, chunk_size: int = 65536
+    ) -> int:
+        """
+        将响应正文分块流式写入文件，内存中同时只保留一个分块
 
-        if self.proxy:
-            kwargs["proxy"] = self.proxy
+        Args:
+            url: 请求 URL
+            path: 目标文件路径
+            digest: 可选的 hashlib 哈希对象，写入的同时更新
+            chunk_size: 分块大小（字节）
 
-        try:
-            async with session.request(method, url, **kwargs) as response:
-                response.raise_for_status()
-                return await response.read()
-        except aiohttp.ClientError as e:
-            self.logger.error(f"网络请求失败: {e}")
-            raise NetworkError(f"网络请求失败: {str(e)}")
+        Returns:
+            写入的字节数
+
+        Raises:
+            NetworkError: 网络请求失败
+        """
+        size = 0
+        async with self._request("GET", url, raise_not_found=False) as response:
+            f = await asyncio.to_thread(open, path, "wb")
+            try:
+                async for chunk in response.content.iter_chunked(chunk_size):
+                    if digest is not None:
+                        digest.update(chunk)
+                    await asyncio.to_thread(f.write, chunk)
+                    size += len(chunk)
+            finally:
+                await asyncio.to_thread(f.close)
+        return size
+
+    async def fetch_with_min_size(
+        self, url: str, min_size: int = MIN_PAGE_SIZE, method: str = "GET", **kwargs
+    ) -> Optional[str]:
+        """
+        流式读取响应，内容不超过 min_size 字节时视为错误页并返回 None
+
+        未压缩且带 Content-Length 的过短响应无需读取正文即可提前返回；
+        只有通过长度检查的内容才会进行解码。
+
+        Args:
+            url: 请求 URL
+            min_size: 有效内容的最小字节数
+            method: HTTP 方法
+            **kwargs: 其他 aiohttp 请求参数
+
+        Returns:
+            响应文本，内容过短时返回 None
+
+        Raises:
+            NetworkError: 网络请求失败
+        """
+        async with self._request(method, url, **kwargs) as response:
+            content_length = response.content_length
+            if (
+                content_length is not None
+                and content_length <= min_size
+                and aiohttp.hdrs.CONTENT_ENCODING not in response.headers
+            ):
+                return None
+
+            chunks = []
+            size = 0
+            async for chunk in response.content.iter_chunked(8192):
+                chunks.append(chunk)
+                size += len(chunk)
+
+            if size <= min_size:
+                return None
+
+            body = b"".join(chunks)
+            try:
+                return body.decode(response.charset or "utf-8", errors="replace")
+            except LookupError:
+                return body.decode("utf-8", errors="replace")
+
+    def _get_cached_video(self, video_id: str) -> Optional[Video]:
+        """
+        从缓存中获取未过期的 Video 对象
+
+        Args:
+            video_id: 视频 ID
+
+        Returns:
+            Video 对象，未命中或已过期时返回 None
+        """
+        entry = self._video_cache.get(video_id)
+        if entry is None:
+            return None
+
+        expires_at, video = entry
+        if expires_at <= time.monotonic():
+            del self._video_cache[video_id]
+            return None
+
+        self._video_cache.move_to_end(video_id)
+        return video
+
+    def _cache_video(self, video: Video) -> None:
+        """
+        将 Video 对象写入缓存，超出容量时淘汰最久未使用的条目
+
+        Args:
+            video: Video 对象
+        """
+        if self.cache_ttl <= 0 or self.cache_size <= 0:
+            return
+
+        self._video_cache[video.video_id] = (time.monotonic() + self.cache_ttl, video)
+        self._video_cache.move_to_end(video.video_id)
+        while len(self._video_cache) > self.cache_size:
+            self._video_cache.popitem(last=False)
 
     async def get_video(self, video_id: str) -> Video:
         """
         获取视频/房间对象
 
+        缓存有效期内重复请求同一 ID 时直接返回缓存的对象，不再发起网络请求。
+
         Args:
             video_id: 视频 ID、用户名或 URL
 
@@ -144,6 +503,10 @@ class Client:
         else:
             video = Video(video_id)
 
+        cached = self._get_cached_video(video.video_id)
+        if cached is not None:
+            return cached
+
         # 正确的 URL 格式是直接 /{username}/
         # xview.tv 只使用这种格式，不使用 /room/ 或 /video/
         urls_to_try = [
@@ -155,8 +518,8 @@ class Client:
 
         for url in urls_to_try:
             try:
-                html_content = await self.fetch(url)
-                if html_content and len(html_content) > 1000:
+                html_content = await self.fetch_with_min_size(url)
+                if html_content:
                     video.url = url
                     break
             except Exception as e:
@@ -169,6 +532,7 @@ class Client:
             raise VideoNotFound(f"无法获取视频/房间: {video_id}")
 
         video.set_html_content(html_content)
+        self._cache_video(video)
         return video
 
     async def get_video_info(self, video_id: str) -> Dict[str, Any]:
@@ -223,6 +587,19 @@ class Client:
             缩略图字节数据
         """
         video = await self.get_video(video_id)
+        return await self.download_thumbnail_for(video, blur_level)
+
+    async def download_thumbnail_for(self, video: Video, blur_level: int = 0) -> Optional[bytes]:
+        """
+        下载已获取的视频对象的缩略图
+
+        Args:
+            video: Video 对象
+            blur_level: 模糊程度 (0-100)
+
+        Returns:
+            缩略图字节数据
+        """
         thumbnail_url = video.thumbnail
 
         if not thumbnail_url:
@@ -251,36 +628,14 @@ class Client:
         Returns:
             模糊后的图片数据
         """
-        try:
-            from PIL import Image, ImageFilter
-            import io
-
-            # 将字节转换为 PIL Image
-            img = Image.open(io.BytesIO(image_data))
-
-            # 计算模糊半径（基于模糊程度）
-            # blur_level 0-100 映射到 radius 0-50
-            radius = blur_level / 2
-
-            # 应用高斯模糊
-            blurred = img.filter(ImageFilter.GaussianBlur(radius=radius))
-
-            # 如果模糊程度很高，添加像素化效果
-            if blur_level > 50:
-                # 缩小再放大以产生马赛克效果
-                factor = max(1, (blur_level - 50) // 10)
-                small_size = (max(1, img.width // (factor * 2)), max(1, img.height // (factor * 2)))
-                blurred = blurred.resize(small_size, Image.NEAREST)
-                blurred = blurred.resize(img.size, Image.NEAREST)
-
-            # 转换回字节
-            output = io.BytesIO()
-            blurred.save(output, format='JPEG', quality=85)
-            return output.getvalue()
-
-        except ImportError:
+        if not _HAS_PIL:
             self.logger.warning("PIL 未安装，无法进行图片模糊处理")
             return image_data
+
+        try:
+            # PIL 处理是同步的 CPU 密集操作，放到线程池中执行以免阻塞事件循环
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_executor(), _blur_sync, image_data, blur_level)
         except Exception as e:
             self.logger.error(f"图片模糊处理失败: {e}")
             return image_data
@@ -304,98 +659,75 @@ class Client:
             f"{ROOT_URL}api/public/cams/?keywords={query}&page={page}",
         ]
 
-        for search_url in search_urls:
-            try:
-                html_content = await self.fetch(search_url)
+        # 并发请求所有候选 URL，采用最先返回有效结果的那个
+        tasks = [asyncio.ensure_future(self.fetch_raw(search_url)) for search_url in search_urls]
+        try:
+            for future in asyncio.as_completed(tasks):
+                try:
+                    html_content = await future
+                except Exception as e:
+                    self.logger.debug(f"搜索请求失败: {e}")
+                    continue
+
                 # 解析搜索结果
                 videos = self._parse_search_results(html_content)
                 if videos:
                     return videos
-            except Exception as e:
-                self.logger.debug(f"搜索 URL {search_url} 失败: {e}")
-                continue
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
 
         # 如果所有 URL 都失败，返回空列表
         self.logger.warning(f"搜索 '{query}' 未找到结果")
         return []
 
-    def _parse_search_results(self, html_content: str) -> List[Dict[str, Any]]:
+    def _parse_search_results(self, html_content: bytes) -> List[Dict[str, Any]]:
         """
         解析搜索结果页面
 
         Args:
-            html_content: HTML 内容
+            html_content: HTML 原始字节（传入 str 时会先编码为 UTF-8）
 
         Returns:
             视频/房间信息列表
         """
-        import re
-        from .consts import REGEX_VIDEO_ID
+        if isinstance(html_content, str):
+            html_content = html_content.encode("utf-8")
+
+        # 单次扫描，按模式分别收集；模式优先级: 房间链接 > data 属性 > JSON 数据
+        buckets: Dict[str, List[bytes]] = {"room": [], "user": [], "json": []}
+        seen: Dict[str, set] = {"room": set(), "user": set(), "json": set()}
+        rooms = buckets["room"]
+
+        for match in REGEX_SEARCH_COMBINED.finditer(html_content):
+            group = match.lastgroup
+            value = match.group(group)
+            if not value or value in seen[group]:
+                continue
+            if group == "room" and value.startswith((b'css', b'js', b'static')):
+                continue
+            if group == "json" and len(value) <= 2:
+                continue
+
+            seen[group].add(value)
+            buckets[group].append(value)
+            # 房间链接优先级最高，已取满时无需继续扫描
+            if len(rooms) >= MAX_SEARCH_RESULTS:
+                break
 
+        ids = rooms or buckets["user"] or buckets["json"]
+        root_url = ROOT_URL
         results = []
-        
-        # 模式1: 提取房间/视频链接 - 匹配类似 /room/username 或 /video/123 的链接
-        room_pattern = re.compile(
-            r'<a[^>]+href=["\']/?(?:room|video|profile)/([^"\'/]+)["\'][^>]*>',
-            re.DOTALL | re.IGNORECASE
-        )
-        
-        # 模式2: 提取带缩略图的链接（暂不使用，保留备用）
-        # thumb_pattern = re.compile(
-        #     r'<a[^>]+href=["\']([^"\']*/(?:room|video|profile)/[^"\'/]+)["\'][^>]*>.*?<img[^>]+src=["\']([^"\']+-thumb[^"\']*)["\']',
-        #     re.DOTALL | re.IGNORECASE
-        # )
-
-        # 模式3: 提取用户名/房间名
-        username_pattern = re.compile(
-            r'data-(?:username|room|id)=["\']([^"\'/]+)["\']',
-            re.IGNORECASE
-        )
-        
-        # 模式4: JSON 数据中的房间信息
-        json_room_pattern = re.compile(
-            r'["\'](?:username|room_id|id)["\']\s*:\s*["\']([^"\'/]+)["\']',
-            re.IGNORECASE
-        )
-
-        seen_ids = set()
-        
-        # 尝试模式1
-        for match in room_pattern.finditer(html_content):
-            room_id = match.group(1)
-            if room_id and room_id not in seen_ids and not room_id.startswith(('css', 'js', 'static')):
-                seen_ids.add(room_id)
-                results.append({
-                    "video_id": room_id,
-                    "url": f"{ROOT_URL}{room_id}/",  # 正确格式: /{username}/
-                    "thumbnail": "",
-                })
-        
-        # 尝试模式3（如果模式1没找到结果）
-        if not results:
-            for match in username_pattern.finditer(html_content):
-                username = match.group(1)
-                if username and username not in seen_ids:
-                    seen_ids.add(username)
-                    results.append({
-                        "video_id": username,
-                        "url": f"{ROOT_URL}{username}/",  # 正确格式: /{username}/
-                        "thumbnail": "",
-                    })
-        
-        # 尝试模式4
-        if not results:
-            for match in json_room_pattern.finditer(html_content):
-                room_id = match.group(1)
-                if room_id and room_id not in seen_ids and len(room_id) > 2:
-                    seen_ids.add(room_id)
-                    results.append({
-                        "video_id": room_id,
-                        "url": f"{ROOT_URL}{room_id}/",  # 正确格式: /{username}/
-                        "thumbnail": "",
-                    })
-
-        return results[:20]  # 最多返回20个结果
+        for raw_id in ids[:MAX_SEARCH_RESULTS]:
+            # 只解码命中的片段
+            room_id = raw_id.decode("utf-8", "replace")
+            results.append({
+                "video_id": room_id,
+                "url": f"{root_url}{room_id}/",  # 正确格式: /{username}/
+                "thumbnail": "",
+            })
+        return results
 
     async def get_categories(self) -> List[Dict[str, str]]:
         """
@@ -421,7 +753,7 @@ class Client:
         category_url = f"{ROOT_URL}category/{category}?page={page}"
 
         try:
-            html_content = await self.fetch(category_url)
+            html_content = await self.fetch_raw(category_url)
             videos = self._parse_search_results(html_content)
             return videos
         except Exception as e:
@@ -3,6 +3,8 @@ XView API 常量定义
 """
 import re
 
+from multidict import CIMultiDict, CIMultiDictProxy
+
 # 基础 URL
 ROOT_URL = "https://secure.xview.tv/"
 
@@ -27,9 +29,14 @@ HEADERS = {
     "Cookie": "agreeterms=1; age_verified=1; sbr=sec:xview.tv; has_signing_key=1",
 }
 
+# 预先规范化的只读请求头，会话创建时无需再次转换
+FROZEN_HEADERS = CIMultiDictProxy(CIMultiDict(HEADERS))
+
 # 正则表达式 - 提取视频 ID
 REGEX_VIDEO_ID = re.compile(r"/video/(\d+)")
 REGEX_VIDEO_ID_ALT = re.compile(r"video[/-](\d+)")
+# 合并两种格式，一次扫描即可取得最靠前的匹配（分组 1 为主格式，分组 2 为备用格式）
+REGEX_VIDEO_ID_COMBINED = re.compile(rf"{REGEX_VIDEO_ID.pattern}|{REGEX_VIDEO_ID_ALT.pattern}")
 
 # 正则表达式 - 提取视频信息
 REGEX_VIDEO_TITLE = re.compile(r'<title>([^<]+)</title>', re.IGNORECASE)
@@ -38,6 +45,8 @@ REGEX_VIDEO_DESCRIPTION = re.compile(r'<meta\s+property=["\']og:description["\']
 REGEX_VIDEO_THUMBNAIL = re.compile(r'<meta\s+property=["\']og:image["\']\s+content=["\']([^"\']+)["\']', re.IGNORECASE)
 REGEX_VIDEO_DURATION = re.compile(r'<meta\s+property=["\']video:duration["\']\s+content=["\'](\d+)["\']', re.IGNORECASE)
 REGEX_VIDEO_DURATION_ALT = re.compile(r'duration["\']?\s*[:=]\s*["\']?(\d+)', re.IGNORECASE)
+# ISO 8601 时长格式 (如 "PT1H30M45S")
+REGEX_ISO_DURATION = re.compile(r'PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?', re.IGNORECASE)
 
 # 正则表达式 - 提取视频源
 REGEX_VIDEO_SOURCE = re.compile(r'<source\s+src=["\']([^"\']+)["\']', re.IGNORECASE)
@@ -52,6 +61,8 @@ REGEX_VIDEO_QUALITY = re.compile(r'(\d{3,4})p', re.IGNORECASE)
 REGEX_VIDEO_VIEWS = re.compile(r'(?:views?|播放)["\']?\s*[:=]?\s*["\']?([\d,]+)', re.IGNORECASE)
 REGEX_VIDEO_RATING = re.compile(r'(?:rating|评分)["\']?\s*[:=]?\s*["\']?([\d.]+)', re.IGNORECASE)
 REGEX_VIDEO_LIKES = re.compile(r'(?:likes?|喜欢)["\']?\s*[:=]?\s*["\']?([\d,]+)', re.IGNORECASE)
+# 可安全交给 float() 的十进制数（"4"、"4."、".5"、"4.5"），配合 fullmatch 使用
+REGEX_FLOAT = re.compile(r'\d+\.?\d*|\.\d+')
 
 # 正则表达式 - 提取上传者信息
 REGEX_VIDEO_UPLOADER = re.compile(r'(?:uploader|author|user)["\']?\s*[:=]\s*["\']([^"\']+)["\']', re.IGNORECASE)
@@ -67,72 +78,165 @@ REGEX_VIDEO_DATE = re.compile(r'(?:upload|date|published)["\']?\s*[:=]\s*["\']?(
 REGEX_VIDEO_DISABLED = re.compile(r'(?:video\s*(?:not\s*found|removed|deleted|disabled)|404|error)', re.IGNORECASE)
 
 # 正则表达式 - JSON-LD 数据
-REGEX_JSON_LD = re.compile(r'<script[^>]+type=["\']application/ld\+json["\'][^>]*>(.*?)</script>', re.IGNORECASE | re.DOTALL)
+REGEX_JSON_LD = re.compile(r'<script[^>]+type=["\']application/ld\+json["\'][^>]*>\s*(.*?)\s*</script>', re.IGNORECASE | re.DOTALL)
+
+# 正则表达式 - 搜索结果解析
+# 直接在响应原始字节上匹配（模式均为 ASCII），省去整页解码
+# 模式1: 房间/视频链接 - 匹配类似 /room/username 或 /video/123 的链接
+_SEARCH_ROOM_PATTERN = rb'<a[^>]+href=["\']/?(?:room|video|profile)/(?P<room>[^"\'/]+)["\'][^>]*>'
+# 模式2: 用户名/房间名 data 属性
+_SEARCH_USERNAME_PATTERN = rb'data-(?:username|room|id)=["\'](?P<user>[^"\'/]+)["\']'
+# 模式3: JSON 数据中的房间信息
+_SEARCH_JSON_ROOM_PATTERN = rb'["\'](?:username|room_id|id)["\']\s*:\s*["\'](?P<json>[^"\'/]+)["\']'
+
+# 三种模式合并为一个分支表达式，只需扫描一次 HTML，通过命名分组区分来源
+REGEX_SEARCH_COMBINED = re.compile(
+    b"|".join((_SEARCH_ROOM_PATTERN, _SEARCH_USERNAME_PATTERN, _SEARCH_JSON_ROOM_PATTERN)),
+    re.IGNORECASE | re.DOTALL,
+)
+
+# 搜索结果最大数量
+MAX_SEARCH_RESULTS = 20
 
 # 正则表达式 - 主播个人资料信息 (xview.tv div 结构)
 # 格式: <div class="label">标签:</div>\n<div class="data">值</div>
 
+
 # 通用 div.label + div.data 模式匹配函数用的基础模式
-def _make_profile_regex(label_pattern: str) -> re.Pattern:
+def _make_profile_regex(label_pattern: str, value_pattern: str = r'[^<]+?') -> re.Pattern:
     """创建匹配 div.label + div.data 结构的正则表达式"""
     return re.compile(
-        rf'<div[^>]*class=["\']label["\'][^>]*>\s*{label_pattern}[:\s：]*</div>\s*<div[^>]*class=["\']data["\'][^>]*>\s*([^<]+?)\s*</div>',
+        rf'<div[^>]*class=["\']label["\'][^>]*>\s*{label_pattern}[:\s：]*</div>\s*<div[^>]*class=["\']data["\'][^>]*>\s*({value_pattern})\s*</div>',
+        re.IGNORECASE | re.DOTALL
+    )
+
+
+def _make_profile_alt_regex(label_pattern: str, value_pattern: str = r'[^<]+') -> re.Pattern:
+    """
+    创建只以标签文本为锚点的备用正则表达式
+
+    不要求 class="label" / class="data"，用于覆盖其他 div 变体；
+    优先级低于严格的 div.label 结构，避免页面中较早出现的同名文本抢先命中
+    """
+    return re.compile(
+        rf'{label_pattern}[:\s：]*</div>\s*<div[^>]*>\s*({value_pattern})',
         re.IGNORECASE | re.DOTALL
     )
 
 # 真名
 REGEX_PROFILE_REAL_NAME = _make_profile_regex(r'(?:Real\s*Name|真名)')
-REGEX_PROFILE_REAL_NAME_ALT = re.compile(r'(?:Real\s*Name|真名)[:\s：]*</div>\s*<div[^>]*>\s*([^<]+)', re.IGNORECASE)
+REGEX_PROFILE_REAL_NAME_ALT = _make_profile_alt_regex(r'(?:Real\s*Name|真名)')
 
-# 关注者
-REGEX_PROFILE_FOLLOWERS = _make_profile_regex(r'(?:Followers|关注者)')
-REGEX_PROFILE_FOLLOWERS_ALT = re.compile(r'(?:Followers|关注者)[:\s：]*</div>\s*<div[^>]*>\s*([\d,]+)', re.IGNORECASE)
+# 关注者 - 严格模式只接受数字，值不是数字时该处不被消耗，同一位置的备用模式仍可命中
+REGEX_PROFILE_FOLLOWERS = _make_profile_regex(r'(?:Followers|关注者)', r'[\d,]+')
+REGEX_PROFILE_FOLLOWERS_ALT = _make_profile_alt_regex(r'(?:Followers|关注者)', r'[\d,]+')
 REGEX_PROFILE_FOLLOWERS_DATA = re.compile(r'(?:follower_count|num_followers)["\']?\s*[:=]\s*["\']?([\d,]+)', re.IGNORECASE)
 
 # 性别
 REGEX_PROFILE_GENDER = _make_profile_regex(r'(?:I\s*am|我是)')
-REGEX_PROFILE_GENDER_ALT = re.compile(r'(?:I\s*am|我是)[:\s：]*</div>\s*<div[^>]*>\s*([^<]+)', re.IGNORECASE)
+REGEX_PROFILE_GENDER_ALT = _make_profile_alt_regex(r'(?:I\s*am|我是)')
 REGEX_PROFILE_GENDER_DATA = re.compile(r'(?:gender|sex)["\']?\s*[:=]\s*["\']([^"\']+)["\']', re.IGNORECASE)
 
 # 兴趣对象
 REGEX_PROFILE_INTERESTS = _make_profile_regex(r'(?:Interested\s*In|对以下选项有兴趣)[：:]?')
-REGEX_PROFILE_INTERESTS_ALT = re.compile(r'(?:Interested\s*In|对以下选项有兴趣)[:\s：]*</div>\s*<div[^>]*>\s*([^<]+)', re.IGNORECASE)
+REGEX_PROFILE_INTERESTS_ALT = _make_profile_alt_regex(r'(?:Interested\s*In|对以下选项有兴趣)')
 
 # 位置
 REGEX_PROFILE_LOCATION = _make_profile_regex(r'(?:Location|位置)')
-REGEX_PROFILE_LOCATION_ALT = re.compile(r'(?:Location|位置)[:\s：]*</div>\s*<div[^>]*>\s*([^<]+)', re.IGNORECASE)
+REGEX_PROFILE_LOCATION_ALT = _make_profile_alt_regex(r'(?:Location|位置)')
 REGEX_PROFILE_LOCATION_DATA = re.compile(r'(?:location|country)["\']?\s*[:=]\s*["\']([^"\']+)["\']', re.IGNORECASE)
 
 # 上次直播时间
 REGEX_PROFILE_LAST_BROADCAST = _make_profile_regex(r'(?:Last\s*Broadcast|上次直播时间|上次直播的时间)')
-REGEX_PROFILE_LAST_BROADCAST_ALT = re.compile(r'(?:Last\s*Broadcast|上次直播时间|上次直播的时间)[:\s：]*</div>\s*<div[^>]*>\s*([^<]+)', re.IGNORECASE)
+REGEX_PROFILE_LAST_BROADCAST_ALT = _make_profile_alt_regex(r'(?:Last\s*Broadcast|上次直播时间|上次直播的时间)')
 
 # 语言
 REGEX_PROFILE_LANGUAGES = _make_profile_regex(r'(?:Languages?|语言)')
-REGEX_PROFILE_LANGUAGES_ALT = re.compile(r'(?:Languages?|语言)[:\s：]*</div>\s*<div[^>]*>\s*([^<]+)', re.IGNORECASE)
+REGEX_PROFILE_LANGUAGES_ALT = _make_profile_alt_regex(r'(?:Languages?|语言)')
 
 # 体型
 REGEX_PROFILE_BODY_TYPE = _make_profile_regex(r'(?:Body\s*Type|体型)')
-REGEX_PROFILE_BODY_TYPE_ALT = re.compile(r'(?:Body\s*Type|体型)[:\s：]*</div>\s*<div[^>]*>\s*([^<]+)', re.IGNORECASE)
+REGEX_PROFILE_BODY_TYPE_ALT = _make_profile_alt_regex(r'(?:Body\s*Type|体型)')
 
 # 身体装饰
 REGEX_PROFILE_BODY_DECORATIONS = _make_profile_regex(r'(?:Body\s*Decorations?|身体装饰)')
-REGEX_PROFILE_BODY_DECORATIONS_ALT = re.compile(r'(?:Body\s*Decorations?|身体装饰)[:\s：]*</div>\s*<div[^>]*>\s*([^<]+)', re.IGNORECASE)
+REGEX_PROFILE_BODY_DECORATIONS_ALT = _make_profile_alt_regex(r'(?:Body\s*Decorations?|身体装饰)')
 
 # 年龄 - 需要更严格的匹配，避免匹配到其他数字如 HTTP 429
-REGEX_PROFILE_AGE = _make_profile_regex(r'(?:Age|年龄)')
-REGEX_PROFILE_AGE_ALT = re.compile(r'<div[^>]*class=["\']label["\'][^>]*>\s*(?:Age|年龄)[:\s：]*</div>\s*<div[^>]*class=["\']data["\'][^>]*>\s*(\d{1,3})\s*</div>', re.IGNORECASE)
+# 要求完整的 div.label + div.data 结构，避免 "Page:" 等以 age 结尾的标签误匹配
+REGEX_PROFILE_AGE = re.compile(r'<div[^>]*class=["\']label["\'][^>]*>\s*(?:Age|年龄)[:\s：]*</div>\s*<div[^>]*class=["\']data["\'][^>]*>\s*(\d{1,3})\s*</div>', re.IGNORECASE)
 # 不再使用过于宽泛的 age 匹配模式，避免误匹配
 REGEX_PROFILE_AGE_DATA = re.compile(r'"age"\s*:\s*(\d{1,3})(?:\D|$)', re.IGNORECASE)
 
+# 资料字段与对应正则，同一字段按优先级排列：
+# 首个为严格的 div.label 结构，其次为只以标签文本为锚点的备用模式，最后为 JSON 等后备模式
+PROFILE_FIELD_PATTERNS = {
+    "real_name": (REGEX_PROFILE_REAL_NAME, REGEX_PROFILE_REAL_NAME_ALT),
+    "followers": (REGEX_PROFILE_FOLLOWERS, REGEX_PROFILE_FOLLOWERS_ALT, REGEX_PROFILE_FOLLOWERS_DATA),
+    "gender": (REGEX_PROFILE_GENDER, REGEX_PROFILE_GENDER_ALT, REGEX_PROFILE_GENDER_DATA),
+    "interested_in": (REGEX_PROFILE_INTERESTS, REGEX_PROFILE_INTERESTS_ALT),
+    "location": (REGEX_PROFILE_LOCATION, REGEX_PROFILE_LOCATION_ALT, REGEX_PROFILE_LOCATION_DATA),
+    "last_broadcast": (REGEX_PROFILE_LAST_BROADCAST, REGEX_PROFILE_LAST_BROADCAST_ALT),
+    "languages": (REGEX_PROFILE_LANGUAGES, REGEX_PROFILE_LANGUAGES_ALT),
+    "body_type": (REGEX_PROFILE_BODY_TYPE, REGEX_PROFILE_BODY_TYPE_ALT),
+    "body_decorations": (REGEX_PROFILE_BODY_DECORATIONS, REGEX_PROFILE_BODY_DECORATIONS_ALT),
+    "age": (REGEX_PROFILE_AGE, REGEX_PROFILE_AGE_DATA),
+}
+
+
+def _make_combined_regex(named_patterns) -> re.Pattern:
+    """将多个正则合并为一个命名分组分支表达式，每个分支内部的第一个分组为取值分组"""
+    return re.compile(
+        "|".join(f"(?P<{name}>{pattern.pattern})" for name, pattern in named_patterns),
+        re.IGNORECASE | re.DOTALL
+    )
+
+
+# 分组名格式为 "{字段}__{优先级}"；严格的 div.label 分支排在前面，同一位置优先尝试。
+# 各分支分别记录首个匹配，取值时按优先级选择，因此页面靠前的备用匹配不会盖过靠后的严格匹配
+_PROFILE_LABEL_GROUPS = [
+    (f"{field}__0", patterns[0]) for field, patterns in PROFILE_FIELD_PATTERNS.items()
+]
+_PROFILE_FALLBACK_GROUPS = [
+    (f"{field}__{rank}", pattern)
+    for field, patterns in PROFILE_FIELD_PATTERNS.items()
+    for rank, pattern in enumerate(patterns[1:], 1)
+]
+# 一次 finditer 即可收集所有资料字段
+REGEX_PROFILE_COMBINED = _make_combined_regex(_PROFILE_LABEL_GROUPS + _PROFILE_FALLBACK_GROUPS)
+
+# 视频源合并正则：一次扫描同时匹配 source 标签、MP4/M3U8 链接和 JS 变量，
+# 分组名即来源类型（src/mp4/m3u8/js）
+REGEX_VIDEO_SOURCE_COMBINED = _make_combined_regex([
+    ("src", REGEX_VIDEO_SOURCE),
+    ("mp4", REGEX_VIDEO_SOURCE_MP4),
+    ("m3u8", REGEX_VIDEO_SOURCE_M3U8),
+    ("js", REGEX_VIDEO_SOURCE_JS),
+])
+
+# 主模式 + 后备模式的合并正则：分组 "primary" 优先，"fallback" 仅在主模式无匹配时采用
+REGEX_VIDEO_DURATION_COMBINED = _make_combined_regex([
+    ("primary", REGEX_VIDEO_DURATION),
+    ("fallback", REGEX_VIDEO_DURATION_ALT),
+])
+REGEX_VIDEO_UPLOADER_COMBINED = _make_combined_regex([
+    ("primary", REGEX_VIDEO_UPLOADER),
+    ("fallback", REGEX_VIDEO_UPLOADER_ALT),
+])
+
 # 社交媒体链接
 REGEX_PROFILE_SOCIAL_MEDIA = re.compile(r'<a[^>]+href=["\']([^"\']+(?:twitter|x\.com|instagram|snapchat|onlyfans|fansly|tiktok|youtube)[^"\']*)["\'][^>]*>', re.IGNORECASE)
 
 # 是否在线
 REGEX_PROFILE_IS_ONLINE = re.compile(r'(?:"is_online"\s*:\s*|"online"\s*:\s*)(true|1|"yes")', re.IGNORECASE)
 REGEX_PROFILE_IS_STREAMING = re.compile(r'class=["\'][^"\']*\b(?:online|streaming|live)\b[^"\']*["\']', re.IGNORECASE)
+# 两种在线标记任一命中即可，合并后只需扫描一次
+REGEX_PROFILE_ONLINE_COMBINED = _make_combined_regex([
+    ("online", REGEX_PROFILE_IS_ONLINE),
+    ("streaming", REGEX_PROFILE_IS_STREAMING),
+])
 
-# 质量映射
+# 质量映射（Video.get_video_url 中以 match 语句实现相同语义，此处保留供外部使用）
 QUALITY_MAP = {
     "best": -1,
     "worst": 0,
@@ -150,4 +254,29 @@ SUPPORTED_FORMATS = ["mp4", "m3u8", "webm"]
 
 # 默认超时设置
 DEFAULT_TIMEOUT = 30
-REQUEST_TIMEOUT = 60
\ No newline at end of file
+REQUEST_TIMEOUT = 60
+
+# 有效页面的最小字节数，低于此长度视为错误页
+MIN_PAGE_SIZE = 1000
+
+# 连接池设置
+DEFAULT_POOL_LIMIT = 100
+DEFAULT_POOL_LIMIT_PER_HOST = 20
+KEEPALIVE_TIMEOUT = 75
+
+# 限速设置：每个主机每秒请求数，收到 429 时速率减半，成功后逐步恢复
+RATE_LIMIT_PER_SECOND = 50
+RATE_LIMIT_MIN_PER_SECOND = 1
+RATE_LIMIT_MAX_RETRIES = 2
+RETRY_AFTER_DEFAULT = 1  # 秒
+RETRY_AFTER_MAX = 30  # 秒
+
+# 图片模糊处理线程池大小
+BLUR_MAX_WORKERS = 4
+
+# 视频对象缓存设置
+VIDEO_CACHE_TTL = 300  # 秒
+VIDEO_CACHE_SIZE = 256
+
+# 缩略图文件缓存最大条目数
+THUMB_CACHE_SIZE = 64
\ No newline at end of file
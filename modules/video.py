@@ -2,66 +2,53 @@
 XView API Video 类
 用于解析和获取视频信息
 """
-import re
 import json
 import html
 import logging
-from functools import cached_property
-from typing import Optional, List, Dict, Any
-from urllib.parse import urljoin
+from functools import lru_cache
+from typing import Optional, List, Dict, Any, Iterator, Union
+
+try:
+    import orjson
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    _HAS_SELECTOLAX = True
+except ImportError:
+    _HAS_SELECTOLAX = False
 
 from .consts import (
     ROOT_URL,
     REGEX_VIDEO_ID,
-    REGEX_VIDEO_ID_ALT,
+    REGEX_VIDEO_ID_COMBINED,
     REGEX_VIDEO_TITLE,
     REGEX_VIDEO_TITLE_META,
     REGEX_VIDEO_DESCRIPTION,
     REGEX_VIDEO_THUMBNAIL,
     REGEX_VIDEO_DURATION,
-    REGEX_VIDEO_DURATION_ALT,
-    REGEX_VIDEO_SOURCE,
+    REGEX_VIDEO_DURATION_COMBINED,
+    REGEX_ISO_DURATION,
+    REGEX_FLOAT,
     REGEX_VIDEO_SOURCE_MP4,
     REGEX_VIDEO_SOURCE_M3U8,
-    REGEX_VIDEO_SOURCE_JS,
-    REGEX_VIDEO_QUALITY,
+    REGEX_VIDEO_SOURCE_COMBINED,
     REGEX_VIDEO_VIEWS,
     REGEX_VIDEO_RATING,
     REGEX_VIDEO_LIKES,
     REGEX_VIDEO_UPLOADER,
-    REGEX_VIDEO_UPLOADER_ALT,
+    REGEX_VIDEO_UPLOADER_COMBINED,
     REGEX_VIDEO_TAGS,
     REGEX_VIDEO_DATE,
     REGEX_VIDEO_DISABLED,
     REGEX_JSON_LD,
     # 主播个人资料正则
-    REGEX_PROFILE_REAL_NAME,
-    REGEX_PROFILE_REAL_NAME_ALT,
-    REGEX_PROFILE_FOLLOWERS,
-    REGEX_PROFILE_FOLLOWERS_ALT,
-    REGEX_PROFILE_FOLLOWERS_DATA,
-    REGEX_PROFILE_GENDER,
-    REGEX_PROFILE_GENDER_ALT,
-    REGEX_PROFILE_GENDER_DATA,
-    REGEX_PROFILE_INTERESTS,
-    REGEX_PROFILE_INTERESTS_ALT,
-    REGEX_PROFILE_LOCATION,
-    REGEX_PROFILE_LOCATION_ALT,
-    REGEX_PROFILE_LOCATION_DATA,
-    REGEX_PROFILE_LAST_BROADCAST,
-    REGEX_PROFILE_LAST_BROADCAST_ALT,
-    REGEX_PROFILE_LANGUAGES,
-    REGEX_PROFILE_LANGUAGES_ALT,
-    REGEX_PROFILE_BODY_TYPE,
-    REGEX_PROFILE_BODY_TYPE_ALT,
-    REGEX_PROFILE_BODY_DECORATIONS,
-    REGEX_PROFILE_BODY_DECORATIONS_ALT,
-    REGEX_PROFILE_AGE,
-    REGEX_PROFILE_AGE_ALT,
-    REGEX_PROFILE_AGE_DATA,
+    PROFILE_FIELD_PATTERNS,
+    REGEX_PROFILE_COMBINED,
     REGEX_PROFILE_SOCIAL_MEDIA,
-    REGEX_PROFILE_IS_ONLINE,
-    REGEX_PROFILE_IS_STREAMING,
+    REGEX_PROFILE_ONLINE_COMBINED,
 )
 from .errors import (
     VideoNotFound,
@@ -71,25 +58,111 @@ from .errors import (
     QualityNotAvailable,
 )
 
+logger = logging.getLogger("XView API - [Video]")
+
+
+@lru_cache(maxsize=1024)
+def _unescape_entities(text: str) -> str:
+    """对含实体的字段做 HTML 反转义，相同字段在多个页面间重复出现时直接命中缓存"""
+    return html.unescape(text)
+
+
+def _unescape(text: str) -> str:
+    """
+    HTML 反转义字段文本，不含 "&" 时直接返回原字符串
+
+    Args:
+        text: 字段文本
+
+    Returns:
+        反转义后的文本
+    """
+    return _unescape_entities(text) if "&" in text else text
+
+
+_MISSING = object()
+
+
+class _cached_property:
+    """
+    与 functools.cached_property 相同的惰性缓存属性，但结果存放在实例的 _cache 字典中，
+    因此可以用于声明了 __slots__ 的类（functools 版本依赖实例 __dict__）
+    """
+
+    def __init__(self, func):
+        self.func = func
+        self.attrname = func.__name__
+        self.__doc__ = func.__doc__
+
+    def __set_name__(self, owner, name: str) -> None:
+        self.attrname = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        cache = instance._cache
+        value = cache.get(self.attrname, _MISSING)
+        if value is _MISSING:
+            value = cache[self.attrname] = self.func(instance)
+        return value
+
 
 class Video:
     """
     视频对象类，用于解析和获取 XView 视频信息
     """
 
-    def __init__(self, video_id: str, html_content: Optional[str] = None):
+    __slots__ = (
+        "_video_id",
+        "_url",
+        "_html_content",
+        "_json_ld_data",
+        "_video_sources",
+        "_parsed_fields",
+        "_meta_tags",
+        "_available_qualities",
+        "_ranked_sources",
+        "_url_cache",
+        "_cache",
+    )
+
+    def __init__(self, video_id: str, html_content: Optional[Union[str, bytes]] = None):
         """
         初始化视频对象
 
         Args:
             video_id: 视频 ID
-            html_content: 可选的 HTML 内容（如果已经获取）
+            html_content: 可选的 HTML 内容（如果已经获取），可以是原始字节
+        """
+        self.reset(video_id, html_content)
+
+    def reset(self, video_id: str, html_content: Optional[Union[str, bytes]] = None) -> None:
+        """
+        重新绑定视频 ID 和 HTML 内容，并清空所有解析结果
+
+        重置后的对象与 Video(video_id, html_content) 新建的对象状态一致，
+        可以在确认没有其他引用时复用同一个实例。
+
+        Args:
+            video_id: 视频 ID
+            html_content: 可选的 HTML 内容（如果已经获取），可以是原始字节
         """
         self._video_id = video_id
-        self._html_content = html_content
+        self._url: Optional[str] = None
+        self._html_content = self._decode_html(html_content) if html_content is not None else None
+        self._clear_parsed()
+
+    def _clear_parsed(self) -> None:
+        """清空依赖页面内容的所有解析结果和缓存属性"""
         self._json_ld_data: Optional[Dict[str, Any]] = None
         self._video_sources: Optional[List[Dict[str, str]]] = None
-        self.logger = logging.getLogger("XView API - [Video]")
+        self._parsed_fields: Optional[Dict[str, str]] = None
+        self._meta_tags: Optional[Dict[str, str]] = None
+        self._available_qualities: List[int] = []
+        self._ranked_sources: Optional[List[Dict[str, Any]]] = None
+        self._url_cache: Dict[str, Optional[str]] = {}
+        # 惰性属性的计算结果
+        self._cache: Dict[str, Any] = {}
 
     @classmethod
     def from_url(cls, url: str, html_content: Optional[str] = None) -> "Video":
@@ -107,6 +180,7 @@ class Video:
         return cls(video_id, html_content)
 
     @staticmethod
+    @lru_cache(maxsize=256)
     def _extract_video_id(url: str) -> str:
         """
         从 URL 中提取视频 ID
@@ -122,13 +196,13 @@ class Video:
         """
         # 尝试从完整 URL 中提取
         if url.startswith(("http://", "https://")):
-            match = REGEX_VIDEO_ID.search(url)
-            if match:
-                return match.group(1)
-
-            match = REGEX_VIDEO_ID_ALT.search(url)
+            match = REGEX_VIDEO_ID_COMBINED.search(url)
             if match:
-                return match.group(1)
+                if match.group(1) is not None:
+                    return match.group(1)
+                # 备用格式出现得更早时，主格式仍然优先
+                primary = REGEX_VIDEO_ID.search(url, match.start())
+                return primary.group(1) if primary else match.group(2)
 
         # 假设输入的就是视频 ID
         if url.isdigit():
@@ -136,18 +210,35 @@ class Video:
 
         raise InvalidURL(f"无法从 URL 中提取视频 ID: {url}")
 
-    def set_html_content(self, content: str) -> None:
+    @staticmethod
+    def _decode_html(content: Union[str, bytes], encoding: str = "utf-8") -> str:
+        """
+        将原始响应字节解码为文本，已是文本时原样返回
+
+        Args:
+            content: HTML 内容或原始字节
+            encoding: 字节内容的编码
+
+        Returns:
+            HTML 文本
+        """
+        if isinstance(content, (bytes, bytearray, memoryview)):
+            try:
+                return str(content, encoding, "replace")
+            except LookupError:
+                return str(content, "utf-8", "replace")
+        return content
+
+    def set_html_content(self, content: Union[str, bytes], encoding: str = "utf-8") -> None:
         """
         设置 HTML 内容并清除缓存
 
         Args:
-            content: HTML 内容
+            content: HTML 内容，也可以直接传入 fetch_raw 得到的原始字节
+            encoding: content 为字节时使用的编码
         """
-        self._html_content = html.unescape(content)
-        # 清除所有缓存属性
-        for attr in list(self.__dict__.keys()):
-            if attr.startswith('_cached_'):
-                delattr(self, attr)
+        self._html_content = html.unescape(self._decode_html(content, encoding))
+        self._clear_parsed()
 
     def _check_video_status(self) -> None:
         """
@@ -182,7 +273,7 @@ class Video:
         matches = REGEX_JSON_LD.findall(self._html_content)
         for match in matches:
             try:
-                data = json.loads(match.strip(), strict=False)
+                data = self._loads_json(match)
                 if isinstance(data, dict):
                     self._json_ld_data.update(self._flatten_dict(data))
                 elif isinstance(data, list):
@@ -194,6 +285,28 @@ class Video:
 
         return self._json_ld_data
 
+    @staticmethod
+    def _loads_json(text: str) -> Any:
+        """
+        解析 JSON 文本，优先使用 orjson
+
+        Args:
+            text: JSON 文本
+
+        Returns:
+            解析结果
+
+        Raises:
+            json.JSONDecodeError: JSON 格式错误
+        """
+        if _HAS_ORJSON:
+            try:
+                return orjson.loads(text)
+            except orjson.JSONDecodeError:
+                # orjson 不接受字符串中的控制字符，交给宽松模式的 json 再试一次
+                pass
+        return json.loads(text, strict=False)
+
     @staticmethod
     def _flatten_dict(d: Dict, parent_key: str = '', sep: str = '_') -> Dict:
         """
@@ -207,14 +320,21 @@ class Video:
         Returns:
             展平后的字典
         """
-        items = []
-        for k, v in d.items():
-            new_key = f"{parent_key}{sep}{k}" if parent_key else k
-            if isinstance(v, dict):
-                items.extend(Video._flatten_dict(v, new_key, sep=sep).items())
+        flat = {}
+        # 显式栈保存 (前缀, 迭代器)，按深度优先顺序写入同一个结果字典，
+        # 与递归实现的键覆盖顺序一致
+        stack = [(parent_key, iter(d.items()))]
+        while stack:
+            prefix, items = stack[-1]
+            for k, v in items:
+                new_key = f"{prefix}{sep}{k}" if prefix else k
+                if isinstance(v, dict):
+                    stack.append((new_key, iter(v.items())))
+                    break
+                flat[new_key] = v
             else:
-                items.append((new_key, v))
-        return dict(items)
+                stack.pop()
+        return flat
 
     @property
     def video_id(self) -> str:
@@ -224,28 +344,71 @@ class Video:
     @property
     def url(self) -> str:
         """获取视频完整 URL"""
-        return getattr(self, '_url', f"{ROOT_URL}{self._video_id}/")
+        if self._url is None:
+            return f"{ROOT_URL}{self._video_id}/"
+        return self._url
     
     @url.setter
     def url(self, value: str) -> None:
         """设置视频 URL"""
         self._url = value
 
-    @cached_property
+    def _parse_meta_tags(self) -> Dict[str, str]:
+        """
+        使用 selectolax 解析一次页面，收集所有 <meta property> 的 content
+
+        Returns:
+            小写 property 名到首个非空 content 的字典
+        """
+        if self._meta_tags is not None:
+            return self._meta_tags
+
+        self._meta_tags = {}
+        if not self._html_content:
+            return self._meta_tags
+
+        tree = LexborHTMLParser(self._html_content)
+        for node in tree.css("meta[property]"):
+            attrs = node.attributes
+            content = attrs.get("content")
+            if content:
+                self._meta_tags.setdefault((attrs.get("property") or "").lower(), content)
+
+        return self._meta_tags
+
+    def _meta_content(self, prop: str) -> Optional[str]:
+        """
+        获取 meta 标签的 content，未安装 selectolax 或标签不存在时返回 None
+
+        Args:
+            prop: property 名 (如 "og:title")
+
+        Returns:
+            content 文本
+        """
+        if not _HAS_SELECTOLAX:
+            return None
+        return self._parse_meta_tags().get(prop)
+
+    @_cached_property
     def title(self) -> Optional[str]:
         """获取视频标题"""
         if not self._html_content:
             return None
 
         # 尝试从 og:title 获取
+        content = self._meta_content("og:title")
+        if content:
+            return _unescape(content.strip())
+
         match = REGEX_VIDEO_TITLE_META.search(self._html_content)
         if match:
-            return html.unescape(match.group(1).strip())
+            return _unescape(match.group(1).strip())
 
         # 尝试从 title 标签获取
         match = REGEX_VIDEO_TITLE.search(self._html_content)
         if match:
-            title = html.unescape(match.group(1).strip())
+            title = _unescape(match.group(1).strip())
             # 移除网站名称后缀
             if " - " in title:
                 title = title.rsplit(" - ", 1)[0]
@@ -258,15 +421,19 @@ class Video:
 
         return None
 
-    @cached_property
+    @_cached_property
     def description(self) -> Optional[str]:
         """获取视频描述"""
         if not self._html_content:
             return None
 
+        content = self._meta_content("og:description")
+        if content:
+            return _unescape(content.strip())
+
         match = REGEX_VIDEO_DESCRIPTION.search(self._html_content)
         if match:
-            return html.unescape(match.group(1).strip())
+            return _unescape(match.group(1).strip())
 
         json_ld = self._parse_json_ld()
         if "description" in json_ld:
@@ -274,12 +441,16 @@ class Video:
 
         return None
 
-    @cached_property
+    @_cached_property
     def thumbnail(self) -> Optional[str]:
         """获取视频缩略图 URL"""
         if not self._html_content:
             return None
 
+        content = self._meta_content("og:image")
+        if content:
+            return content
+
         match = REGEX_VIDEO_THUMBNAIL.search(self._html_content)
         if match:
             return match.group(1)
@@ -290,29 +461,40 @@ class Video:
 
         return None
 
-    @cached_property
+    def _search_ranked(self, primary, combined) -> Optional[str]:
+        """
+        用主模式 + 后备模式的合并正则扫描页面，保持主模式优先的语义
+
+        Args:
+            primary: 主模式正则
+            combined: 由 "primary"、"fallback" 两个分支组成的合并正则
+
+        Returns:
+            主模式的首个捕获值；主模式无匹配时返回后备模式的首个捕获值
+        """
+        match = combined.search(self._html_content)
+        if match is None:
+            return None
+        if match.lastgroup == "primary":
+            return match.group(match.lastindex + 1)
+
+        # 后备模式出现得更早，主模式只可能在其后匹配
+        primary_match = primary.search(self._html_content, match.start())
+        if primary_match:
+            return primary_match.group(1)
+        return match.group(match.lastindex + 1)
+
+    @_cached_property
     def duration(self) -> Optional[int]:
         """获取视频时长（秒）"""
         if not self._html_content:
             return None
 
-        match = REGEX_VIDEO_DURATION.search(self._html_content)
-        if match:
-            try:
-                duration_str = match.group(1).strip()
-                if duration_str and duration_str.isdigit():
-                    return int(duration_str)
-            except (ValueError, TypeError):
-                pass
-
-        match = REGEX_VIDEO_DURATION_ALT.search(self._html_content)
-        if match:
-            try:
-                duration_str = match.group(1).strip()
-                if duration_str and duration_str.isdigit():
-                    return int(duration_str)
-            except (ValueError, TypeError):
-                pass
+        duration_str = self._search_ranked(REGEX_VIDEO_DURATION, REGEX_VIDEO_DURATION_COMBINED)
+        if duration_str is not None:
+            duration_str = duration_str.strip()
+            if duration_str.isdigit():
+                return int(duration_str)
 
         json_ld = self._parse_json_ld()
         if "duration" in json_ld:
@@ -334,8 +516,7 @@ class Video:
         Returns:
             秒数
         """
-        pattern = r'PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?'
-        match = re.match(pattern, duration_str, re.IGNORECASE)
+        match = REGEX_ISO_DURATION.match(duration_str)
         if match:
             hours = int(match.group(1) or 0)
             minutes = int(match.group(2) or 0)
@@ -357,7 +538,7 @@ class Video:
             return f"{hours}:{minutes:02d}:{seconds:02d}"
         return f"{minutes}:{seconds:02d}"
 
-    @cached_property
+    @_cached_property
     def views(self) -> Optional[int]:
         """获取观看次数"""
         if not self._html_content:
@@ -366,7 +547,7 @@ class Video:
         match = REGEX_VIDEO_VIEWS.search(self._html_content)
         if match:
             views_str = match.group(1).replace(",", "").strip()
-            if views_str and views_str.isdigit():
+            if views_str.isdigit():
                 return int(views_str)
 
         json_ld = self._parse_json_ld()
@@ -378,7 +559,7 @@ class Video:
 
         return None
 
-    @cached_property
+    @_cached_property
     def rating(self) -> Optional[float]:
         """获取视频评分"""
         if not self._html_content:
@@ -386,12 +567,10 @@ class Video:
 
         match = REGEX_VIDEO_RATING.search(self._html_content)
         if match:
-            try:
-                rating_str = match.group(1).strip()
-                if rating_str:
-                    return float(rating_str)
-            except (ValueError, TypeError):
-                pass
+            rating_str = match.group(1).strip()
+            # [\d.]+ 可能捕获到 "." 或 "4.5.1" 这类无法转换的片段
+            if REGEX_FLOAT.fullmatch(rating_str):
+                return float(rating_str)
 
         json_ld = self._parse_json_ld()
         if "aggregateRating_ratingValue" in json_ld:
@@ -402,7 +581,7 @@ class Video:
 
         return None
 
-    @cached_property
+    @_cached_property
     def likes(self) -> Optional[int]:
         """获取点赞数"""
         if not self._html_content:
@@ -410,28 +589,21 @@ class Video:
 
         match = REGEX_VIDEO_LIKES.search(self._html_content)
         if match:
-            try:
-                likes_str = match.group(1).replace(",", "").strip()
-                if likes_str and likes_str.isdigit():
-                    return int(likes_str)
-            except (ValueError, TypeError):
-                pass
+            likes_str = match.group(1).replace(",", "").strip()
+            if likes_str.isdigit():
+                return int(likes_str)
 
         return None
 
-    @cached_property
+    @_cached_property
     def uploader(self) -> Optional[str]:
         """获取上传者"""
         if not self._html_content:
             return None
 
-        match = REGEX_VIDEO_UPLOADER.search(self._html_content)
-        if match:
-            return match.group(1)
-
-        match = REGEX_VIDEO_UPLOADER_ALT.search(self._html_content)
-        if match:
-            return match.group(1)
+        uploader = self._search_ranked(REGEX_VIDEO_UPLOADER, REGEX_VIDEO_UPLOADER_COMBINED)
+        if uploader is not None:
+            return uploader
 
         json_ld = self._parse_json_ld()
         if "author_name" in json_ld:
@@ -439,16 +611,17 @@ class Video:
 
         return None
 
-    @cached_property
+    @_cached_property
     def tags(self) -> List[str]:
         """获取视频标签"""
         if not self._html_content:
             return []
 
         matches = REGEX_VIDEO_TAGS.findall(self._html_content)
-        return list(set(matches))
+        # 去重并保持页面中的出现顺序
+        return list(dict.fromkeys(matches))
 
-    @cached_property
+    @_cached_property
     def publish_date(self) -> Optional[str]:
         """获取发布日期"""
         if not self._html_content:
@@ -466,164 +639,136 @@ class Video:
 
     # ==================== 主播个人资料属性 ====================
 
-    @cached_property
-    def real_name(self) -> Optional[str]:
-        """获取主播真名"""
+    def _parse_profile_fields(self) -> Dict[str, str]:
+        """
+        单次扫描 HTML，收集每个资料正则的首个匹配值
+
+        Returns:
+            分组名 ("{字段}__{优先级}") 到匹配值的字典
+        """
+        if self._parsed_fields is not None:
+            return self._parsed_fields
+
+        self._parsed_fields = {}
         if not self._html_content:
-            return None
+            return self._parsed_fields
 
-        for pattern in [REGEX_PROFILE_REAL_NAME, REGEX_PROFILE_REAL_NAME_ALT]:
-            match = pattern.search(self._html_content)
-            if match:
-                return html.unescape(match.group(1).strip())
+        total = len(REGEX_PROFILE_COMBINED.groupindex)
+        for match in REGEX_PROFILE_COMBINED.finditer(self._html_content):
+            name = match.lastgroup
+            if name not in self._parsed_fields:
+                # 取值分组紧跟在命名分组之后
+                self._parsed_fields[name] = match.group(match.lastindex + 1)
+                if len(self._parsed_fields) == total:
+                    break
 
-        return None
+        return self._parsed_fields
 
-    @cached_property
-    def followers(self) -> Optional[int]:
-        """获取关注者数量"""
+    def _profile_candidates(self, field: str) -> Iterator[str]:
+        """
+        按优先级依次返回资料字段的候选值
+
+        Args:
+            field: 字段名
+
+        Returns:
+            候选值迭代器
+        """
+        parsed = self._parse_profile_fields()
+        for rank in range(len(PROFILE_FIELD_PATTERNS[field])):
+            value = parsed.get(f"{field}__{rank}")
+            if value is not None:
+                yield value
+
+    def _profile_text(self, field: str) -> Optional[str]:
+        """获取文本类型的资料字段"""
         if not self._html_content:
             return None
 
-        for pattern in [REGEX_PROFILE_FOLLOWERS, REGEX_PROFILE_FOLLOWERS_ALT, REGEX_PROFILE_FOLLOWERS_DATA]:
-            match = pattern.search(self._html_content)
-            if match:
-                try:
-                    return int(match.group(1).replace(",", "").strip())
-                except (ValueError, TypeError):
-                    continue
-
-        return None
+        value = next(self._profile_candidates(field), None)
+        if value is None:
+            return None
+        return _unescape(value.strip())
 
-    @cached_property
-    def gender(self) -> Optional[str]:
-        """获取性别 (如: A Woman, A Man, A Couple, Trans)"""
+    def _profile_int(self, field: str) -> Optional[int]:
+        """获取数值类型的资料字段，不是有效数字时尝试下一个候选值"""
         if not self._html_content:
             return None
 
-        for pattern in [REGEX_PROFILE_GENDER, REGEX_PROFILE_GENDER_ALT, REGEX_PROFILE_GENDER_DATA]:
-            match = pattern.search(self._html_content)
-            if match:
-                return html.unescape(match.group(1).strip())
+        for value in self._profile_candidates(field):
+            value = value.replace(",", "").strip()
+            if value.isdigit():
+                return int(value)
 
         return None
 
-    @cached_property
-    def interested_in(self) -> Optional[str]:
-        """获取兴趣对象 (如: 女性, 男士, 情侣, 跨性别者)"""
-        if not self._html_content:
-            return None
+    @_cached_property
+    def real_name(self) -> Optional[str]:
+        """获取主播真名"""
+        return self._profile_text("real_name")
 
-        for pattern in [REGEX_PROFILE_INTERESTS, REGEX_PROFILE_INTERESTS_ALT]:
-            match = pattern.search(self._html_content)
-            if match:
-                return html.unescape(match.group(1).strip())
+    @_cached_property
+    def followers(self) -> Optional[int]:
+        """获取关注者数量"""
+        return self._profile_int("followers")
 
-        return None
+    @_cached_property
+    def gender(self) -> Optional[str]:
+        """获取性别 (如: A Woman, A Man, A Couple, Trans)"""
+        return self._profile_text("gender")
 
-    @cached_property
+    @_cached_property
+    def interested_in(self) -> Optional[str]:
+        """获取兴趣对象 (如: 女性, 男士, 情侣, 跨性别者)"""
+        return self._profile_text("interested_in")
+
+    @_cached_property
     def location(self) -> Optional[str]:
         """获取位置/国家"""
-        if not self._html_content:
-            return None
-
-        for pattern in [REGEX_PROFILE_LOCATION, REGEX_PROFILE_LOCATION_ALT, REGEX_PROFILE_LOCATION_DATA]:
-            match = pattern.search(self._html_content)
-            if match:
-                return html.unescape(match.group(1).strip())
-
-        return None
+        return self._profile_text("location")
 
-    @cached_property
+    @_cached_property
     def last_broadcast(self) -> Optional[str]:
         """获取上次直播时间"""
-        if not self._html_content:
-            return None
-
-        for pattern in [REGEX_PROFILE_LAST_BROADCAST, REGEX_PROFILE_LAST_BROADCAST_ALT]:
-            match = pattern.search(self._html_content)
-            if match:
-                return html.unescape(match.group(1).strip())
+        return self._profile_text("last_broadcast")
 
-        return None
-
-    @cached_property
+    @_cached_property
     def languages(self) -> Optional[str]:
         """获取语言"""
-        if not self._html_content:
-            return None
-
-        for pattern in [REGEX_PROFILE_LANGUAGES, REGEX_PROFILE_LANGUAGES_ALT]:
-            match = pattern.search(self._html_content)
-            if match:
-                return html.unescape(match.group(1).strip())
+        return self._profile_text("languages")
 
-        return None
-
-    @cached_property
+    @_cached_property
     def body_type(self) -> Optional[str]:
         """获取体型"""
-        if not self._html_content:
-            return None
+        return self._profile_text("body_type")
 
-        for pattern in [REGEX_PROFILE_BODY_TYPE, REGEX_PROFILE_BODY_TYPE_ALT]:
-            match = pattern.search(self._html_content)
-            if match:
-                return html.unescape(match.group(1).strip())
-
-        return None
-
-    @cached_property
+    @_cached_property
     def body_decorations(self) -> Optional[str]:
         """获取身体装饰 (如: Ink-free, pierced ears)"""
-        if not self._html_content:
-            return None
-
-        for pattern in [REGEX_PROFILE_BODY_DECORATIONS, REGEX_PROFILE_BODY_DECORATIONS_ALT]:
-            match = pattern.search(self._html_content)
-            if match:
-                return html.unescape(match.group(1).strip())
-
-        return None
+        return self._profile_text("body_decorations")
 
-    @cached_property
+    @_cached_property
     def age(self) -> Optional[int]:
         """获取年龄"""
-        if not self._html_content:
-            return None
-
-        for pattern in [REGEX_PROFILE_AGE, REGEX_PROFILE_AGE_ALT, REGEX_PROFILE_AGE_DATA]:
-            match = pattern.search(self._html_content)
-            if match:
-                try:
-                    return int(match.group(1).strip())
-                except (ValueError, TypeError):
-                    continue
-
-        return None
+        return self._profile_int("age")
 
-    @cached_property
+    @_cached_property
     def social_media(self) -> List[str]:
         """获取社交媒体链接列表"""
         if not self._html_content:
             return []
 
         matches = REGEX_PROFILE_SOCIAL_MEDIA.findall(self._html_content)
-        # 去重并返回
-        return list(set(matches))
+        # 去重并保持页面中的出现顺序
+        return list(dict.fromkeys(matches))
 
-    @cached_property
+    @_cached_property
     def is_online(self) -> bool:
         """检查是否在线直播"""
         if not self._html_content:
             return False
 
-        if REGEX_PROFILE_IS_ONLINE.search(self._html_content):
-            return True
-        if REGEX_PROFILE_IS_STREAMING.search(self._html_content):
-            return True
-
-        return False
+        return REGEX_PROFILE_ONLINE_COMBINED.search(self._html_content) is not None
 
     def _extract_video_sources(self) -> List[Dict[str, str]]:
         """
@@ -636,46 +781,60 @@ class Video:
             return self._video_sources
 
         self._video_sources = []
+        self._available_qualities = []
+        # 已收录的 URL 集合，用于 O(1) 去重
+        seen = set()
 
         if not self._html_content:
             return self._video_sources
 
-        # 从 source 标签提取
-        for match in REGEX_VIDEO_SOURCE.finditer(self._html_content):
-            url = match.group(1)
-            quality = self._detect_quality(url)
-            self._video_sources.append({"url": url, "quality": quality, "format": self._detect_format(url)})
-
-        # 从 MP4 链接提取
-        for match in REGEX_VIDEO_SOURCE_MP4.finditer(self._html_content):
-            url = match.group(1)
-            if not any(s["url"] == url for s in self._video_sources):
-                quality = self._detect_quality(url)
-                self._video_sources.append({"url": url, "quality": quality, "format": "mp4"})
-
-        # 从 M3U8 链接提取
-        for match in REGEX_VIDEO_SOURCE_M3U8.finditer(self._html_content):
-            url = match.group(1)
-            if not any(s["url"] == url for s in self._video_sources):
-                quality = self._detect_quality(url)
-                self._video_sources.append({"url": url, "quality": quality, "format": "m3u8"})
-
-        # 从 JS 变量提取
-        for match in REGEX_VIDEO_SOURCE_JS.finditer(self._html_content):
-            url = match.group(1)
-            fmt = match.group(2).lower()
-            if not any(s["url"] == url for s in self._video_sources):
-                quality = self._detect_quality(url)
-                self._video_sources.append({"url": url, "quality": quality, "format": fmt})
+        # 单次扫描，按来源类型分桶，再按 source 标签、MP4、M3U8、JS 变量的顺序合并，
+        # 与逐个模式扫描时的结果顺序一致
+        buckets: Dict[str, List[Dict[str, Any]]] = {"src": [], "mp4": [], "m3u8": [], "js": []}
+        for match in REGEX_VIDEO_SOURCE_COMBINED.finditer(self._html_content):
+            kind = match.lastgroup
+            url = match.group(match.lastindex + 1)
+            if kind == "src":
+                fmt = self._detect_format(url)
+            elif kind == "js":
+                fmt = match.group(match.lastindex + 2).lower()
+            else:
+                fmt = kind
+            buckets[kind].append({"url": url, "quality": self._detect_quality(url), "format": fmt})
+
+            if kind in ("src", "js"):
+                # 合并正则会吞掉分支内部的链接，补扫一次 URL 本身，
+                # 使 MP4/M3U8 链接与逐个扫描时一样先于 JS 变量被收录
+                for inner_fmt, pattern in (("mp4", REGEX_VIDEO_SOURCE_MP4), ("m3u8", REGEX_VIDEO_SOURCE_M3U8)):
+                    for inner in pattern.finditer(url):
+                        inner_url = inner.group(1)
+                        buckets[inner_fmt].append(
+                            {"url": inner_url, "quality": self._detect_quality(inner_url), "format": inner_fmt}
+                        )
+
+        # source 标签不去重，直接收录
+        for source in buckets["src"]:
+            self._video_sources.append(source)
+            seen.add(source["url"])
+
+        for kind in ("mp4", "m3u8", "js"):
+            for source in buckets[kind]:
+                if source["url"] not in seen:
+                    self._video_sources.append(source)
+                    seen.add(source["url"])
 
         # 从 JSON-LD 提取
         json_ld = self._parse_json_ld()
         if "contentUrl" in json_ld:
             url = json_ld["contentUrl"]
-            if not any(s["url"] == url for s in self._video_sources):
+            if url not in seen:
                 quality = self._detect_quality(url)
                 self._video_sources.append({"url": url, "quality": quality, "format": self._detect_format(url)})
 
+        # 顺带整理可用质量列表，避免每次访问 available_qualities 时重新排序
+        qualities = {source["quality"] for source in self._video_sources if source["quality"] > 0}
+        self._available_qualities = sorted(qualities, reverse=True)
+
         return self._video_sources
 
     @staticmethod
@@ -689,9 +848,18 @@ class Video:
         Returns:
             视频质量（如 720, 1080）
         """
-        match = REGEX_VIDEO_QUALITY.search(url)
-        if match:
-            return int(match.group(1))
+        # 等价于 REGEX_VIDEO_QUALITY.search：找到第一个前面紧跟 3 位以上数字的 "p"，
+        # 取其前至多 4 位数字；直接定位 "p" 比让正则逐字符尝试数字快
+        lowered = url.lower()
+        pos = lowered.find("p", 3)
+        while pos != -1:
+            start = pos
+            floor = max(pos - 4, 0)
+            while start > floor and lowered[start - 1].isdecimal():
+                start -= 1
+            if pos - start >= 3:
+                return int(lowered[start:pos])
+            pos = lowered.find("p", pos + 1)
         return 0  # 未知质量
 
     @staticmethod
@@ -722,9 +890,8 @@ class Video:
     @property
     def available_qualities(self) -> List[int]:
         """获取可用的视频质量列表"""
-        sources = self._extract_video_sources()
-        qualities = sorted(set(s["quality"] for s in sources if s["quality"] > 0), reverse=True)
-        return qualities
+        self._extract_video_sources()
+        return list(self._available_qualities)
 
     def get_video_url(self, quality: str = "best") -> Optional[str]:
         """
@@ -736,9 +903,24 @@ class Video:
         Returns:
             视频 URL
         """
+        if quality in self._url_cache:
+            return self._url_cache[quality]
+
+        url = self._select_video_url(quality)
+        self._url_cache[quality] = url
+        return url
+
+    def _rank_sources(self) -> List[Dict[str, Any]]:
+        """
+        筛选并按质量降序排列视频源，结果在页面内容更新前复用
+
+        Returns:
+            优先 MP4 格式、按质量降序排列的视频源列表
+        """
+        if self._ranked_sources is not None:
+            return self._ranked_sources
+
         sources = self._extract_video_sources()
-        if not sources:
-            return None
 
         # 过滤出 MP4 格式
         mp4_sources = [s for s in sources if s["format"] == "mp4"]
@@ -746,27 +928,51 @@ class Video:
             mp4_sources = sources  # 如果没有 MP4，使用所有源
 
         # 按质量排序
-        sorted_sources = sorted(mp4_sources, key=lambda x: x["quality"], reverse=True)
-
-        if quality == "best":
-            return sorted_sources[0]["url"]
-        elif quality == "worst":
-            return sorted_sources[-1]["url"]
-        elif quality == "half":
-            mid_idx = len(sorted_sources) // 2
-            return sorted_sources[mid_idx]["url"]
-        else:
-            # 尝试匹配具体质量
-            try:
-                target_quality = int(quality.replace("p", ""))
-                for source in sorted_sources:
-                    if source["quality"] == target_quality:
-                        return source["url"]
-                # 没有精确匹配，返回最接近的
-                closest = min(sorted_sources, key=lambda x: abs(x["quality"] - target_quality))
-                return closest["url"]
-            except ValueError:
-                return sorted_sources[0]["url"]  # 默认返回最佳质量
+        self._ranked_sources = sorted(mp4_sources, key=lambda x: x["quality"], reverse=True)
+        return self._ranked_sources
+
+    def _select_video_url(self, quality: str) -> Optional[str]:
+        """
+        按质量选项从排好序的视频源中选择 URL
+
+        Args:
+            quality: 质量选项 (best/worst/half) 或具体数值 (720/1080)
+
+        Returns:
+            视频 URL
+        """
+        sorted_sources = self._rank_sources()
+        if not sorted_sources:
+            return None
+
+        # 对字符串字面量使用 match 分派（语义与 QUALITY_MAP 一致）
+        match quality:
+            case "best":
+                return sorted_sources[0]["url"]
+            case "worst":
+                return sorted_sources[-1]["url"]
+            case "half":
+                mid_idx = len(sorted_sources) // 2
+                return sorted_sources[mid_idx]["url"]
+
+        # 尝试匹配具体质量
+        quality_str = quality.replace("p", "")
+        if not quality_str.isdigit():
+            return sorted_sources[0]["url"]  # 默认返回最佳质量
+
+        target_quality = int(quality_str)
+        for source in sorted_sources:
+            if source["quality"] == target_quality:
+                return source["url"]
+        # 没有精确匹配，返回最接近的
+        closest = min(sorted_sources, key=lambda x: abs(x["quality"] - target_quality))
+        return closest["url"]
+
+    def _ensure_parsed(self) -> None:
+        """一次性完成资料字段、JSON-LD 和视频源的整页扫描，之后各属性只做字典查找"""
+        self._parse_profile_fields()
+        self._parse_json_ld()
+        self._extract_video_sources()
 
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -775,6 +981,7 @@ class Video:
         Returns:
             视频信息字典
         """
+        self._ensure_parsed()
         return {
             "video_id": self.video_id,
             "url": self.url,
@@ -806,4 +1013,4 @@ class Video:
         }
 
     def __repr__(self) -> str:
-        return f"Video(id={self.video_id}, title={self.title})"
\ No newline at end of file
+        return f"Video(id={self.video_id}, title={self.title})"